@@ -0,0 +1,63 @@
+"""normalize user emails
+
+Revision ID: 3a8f0c6e1b27
+Revises: bd442a3256ab
+Create Date: 2026-10-15 10:05:41.902117
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "3a8f0c6e1b27"
+down_revision: str | Sequence[str] | None = "bd442a3256ab"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match app.modules.users.models.EMAIL_STRIP_CHARS
+EMAIL_STRIP_CHARS = " \t\n\v\f\r"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not context.is_offline_mode():
+        _check_no_conflicting_emails()
+
+    op.execute(
+        sa.text(
+            "UPDATE users SET email = lower(btrim(email, :strip_chars)) "
+            "WHERE email <> lower(btrim(email, :strip_chars))"
+        ).bindparams(strip_chars=EMAIL_STRIP_CHARS)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Original casing and padding are not recoverable; nothing to undo.
+    pass
+
+
+def _check_no_conflicting_emails() -> None:
+    """Fail with a readable error if normalizing would break ix_users_email."""
+    conflicts = (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT lower(btrim(email, :strip_chars)) AS normalized, "
+                "string_agg(id::text || ' <' || email || '>', ', ' ORDER BY created_at) AS users "
+                "FROM users "
+                "GROUP BY lower(btrim(email, :strip_chars)) "
+                "HAVING count(*) > 1"
+            ).bindparams(strip_chars=EMAIL_STRIP_CHARS)
+        )
+        .all()
+    )
+    if conflicts:
+        details = "\n".join(f"  {row.normalized}: {row.users}" for row in conflicts)
+        raise RuntimeError(
+            "Cannot normalize user emails: these accounts collide once trimmed and "
+            f"lowercased. Merge or rename them, then rerun the migration.\n{details}"
+        )
@@ -0,0 +1,33 @@
+"""add users active/created index
+
+Revision ID: 5c1e7a9d2f40
+Revises: 3a8f0c6e1b27
+Create Date: 2026-10-15 10:12:04.518203
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e7a9d2f40"
+down_revision: str | Sequence[str] | None = "3a8f0c6e1b27"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_is_active_created_at",
+        "users",
+        ["is_active", sa.text("created_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_is_active_created_at", table_name="users")
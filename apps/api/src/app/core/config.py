@@ -50,6 +50,14 @@ class Settings(BaseSettings):
     postgres_password: str = "eksms_dev_password"
     postgres_db: str = "eksms_dev"
 
+    # Connection pool
+    database_pool_size: int = 25
+    database_max_overflow: int = 25
+    # Keep below the server/proxy idle timeout of the hosting provider
+    database_pool_recycle: int = 300  # seconds
+    # Only disable when connections cannot be dropped behind the pool's back
+    database_pool_pre_ping: bool = True
+
     @computed_field
     @property
     def database_url(self) -> str:
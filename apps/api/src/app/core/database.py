@@ -19,9 +19,20 @@ from app.core.config import settings
 engine = create_async_engine(
     settings.database_url,
     echo=settings.is_development,  # Log SQL in development
-    pool_pre_ping=True,  # Verify connections before using
-    pool_size=5,
-    max_overflow=10,
+    pool_size=settings.database_pool_size,
+    max_overflow=settings.database_max_overflow,
+    # Replace connections older than this on checkout (age only, not liveness)
+    pool_recycle=settings.database_pool_recycle,
+    # Detect connections killed by restarts, failovers or idle timeouts
+    pool_pre_ping=settings.database_pool_pre_ping,
+    pool_use_lifo=True,  # Reuse the most recent connection so idle ones can age out
+    connect_args={
+        # JIT planning costs more than it saves on small OLTP queries
+        "server_settings": {"jit": "off", "application_name": "ek-sms-api"},
+        # SQLAlchemy's asyncpg adapter keeps its own per-connection cache of
+        # prepared statements; asyncpg's statement_cache_size is never consulted
+        "prepared_statement_cache_size": 500,
+    },
 )
 
 # Session factory
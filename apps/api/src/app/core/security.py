@@ -4,6 +4,9 @@ Security Utilities
 Password hashing, JWT tokens, and authentication helpers.
 """
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 
 from jose import JWTError, jwt
@@ -11,38 +14,70 @@ from passlib.context import CryptContext
 
 from app.core.config import settings
 
-# Password hashing context using Argon2
+# Password hashing context using Argon2id with OWASP-recommended parameters
+# (19 MiB memory, 2 iterations, 1 lane) instead of library defaults.
 pwd_context = CryptContext(
     schemes=["argon2"],
     deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=19456,
+    argon2__time_cost=2,
+    argon2__parallelism=1,
 )
 
+# Argon2 is pure CPU work; argon2-cffi releases the GIL, so a bounded thread
+# pool keeps hashing off the event loop and lets it scale across cores.
+_password_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="password-hash",
+)
+
+# Verified against when no stored hash exists, so a missing account costs the
+# same Argon2 work as a wrong password and cannot be detected by timing.
+_DUMMY_PASSWORD_HASH = pwd_context.hash("ek-sms-dummy-password")
+
 
-def hash_password(password: str) -> str:
+async def hash_password(password: str) -> str:
     """
     Hash a password using Argon2.
 
+    Runs in a worker thread so the event loop is not blocked.
+
     Args:
         password: Plain text password
 
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, pwd_context.hash, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str | None) -> bool:
     """
     Verify a password against its hash.
 
+    Runs in a worker thread so the event loop is not blocked. Pass
+    ``None`` (or an empty string) when the user does not exist: a dummy
+    hash is verified instead and the result is always False. Timing only
+    matches real accounts whose stored hash uses the current Argon2
+    parameters; legacy hashes made with other parameters still differ.
+
     Args:
         plain_password: Plain text password to verify
-        hashed_password: Stored hash to verify against
+        hashed_password: Stored hash to verify against, or None
 
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    loop = asyncio.get_running_loop()
+    matches = await loop.run_in_executor(
+        _password_executor,
+        pwd_context.verify,
+        plain_password,
+        hashed_password or _DUMMY_PASSWORD_HASH,
+    )
+    return matches and bool(hashed_password)
 
 
 def create_access_token(
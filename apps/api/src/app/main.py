@@ -3,6 +3,7 @@ EK-SMS API - Main Application Entry Point
 """
 
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -92,7 +93,7 @@ async def readiness_check() -> dict[str, str]:
 
 
 @app.get("/debug/db", tags=["Debug"])
-async def debug_db():
+async def debug_db() -> dict[str, Any]:
     """Test database connection."""
     try:
         async with async_session_maker() as session:
@@ -103,7 +104,7 @@ async def debug_db():
 
 
 @app.get("/debug/redis", tags=["Debug"])
-async def debug_redis():
+async def debug_redis() -> dict[str, Any]:
     """Test Redis connection."""
 
     try:
@@ -6,12 +6,16 @@ Database models for user management and authentication.
 
 from enum import Enum
 
-from sqlalchemy import Boolean, String, Text
+from sqlalchemy import Boolean, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import ENUM
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, validates
 
 from app.modules.shared import BaseModel
 
+# Characters stripped from both ends of an email before lowercasing.
+# Kept explicit so the users email backfill migration applies the same rule.
+EMAIL_STRIP_CHARS = " \t\n\v\f\r"
+
 
 class UserRole(str, Enum):
     """User roles in the system."""
@@ -34,6 +38,10 @@ class User(BaseModel):
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        # Serves "active users, newest first" listings for both filter and sort
+        Index("ix_users_is_active_created_at", "is_active", text("created_at DESC")),
+    )
 
     # Authentication fields
     email: Mapped[str] = mapped_column(
@@ -93,6 +101,16 @@ class User(BaseModel):
         nullable=True,
     )
 
+    @validates("email")
+    def _normalize_email(self, _key: str, value: str) -> str:
+        """
+        Store emails trimmed and lowercased so lookups can use the plain unique index.
+
+        Only runs on ORM attribute assignment; Core insert()/update()
+        statements bypass it and must normalize the email themselves.
+        """
+        return value.strip(EMAIL_STRIP_CHARS).lower()
+
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, role={self.role.value})>"
 
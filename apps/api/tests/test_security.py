@@ -0,0 +1,33 @@
+"""
+Password hashing tests.
+"""
+
+from app.core.security import hash_password, verify_password
+
+
+async def test_hash_and_verify_round_trip():
+    """Test a hashed password verifies against its plain text."""
+    hashed = await hash_password("correct horse battery staple")
+    assert await verify_password("correct horse battery staple", hashed) is True
+
+
+async def test_verify_wrong_password():
+    """Test a wrong password does not verify."""
+    hashed = await hash_password("correct horse battery staple")
+    assert await verify_password("wrong password", hashed) is False
+
+
+async def test_hash_uses_owasp_argon2id_parameters():
+    """Test hashes are Argon2id with the configured OWASP parameters."""
+    hashed = await hash_password("correct horse battery staple")
+    assert hashed.startswith("$argon2id$v=19$m=19456,t=2,p=1$")
+
+
+async def test_verify_missing_hash_never_authenticates():
+    """Test a missing hash is rejected, even for the dummy hash's plain text."""
+    assert await verify_password("ek-sms-dummy-password", None) is False
+
+
+async def test_verify_empty_hash_treated_as_missing():
+    """Test an empty stored hash is treated like a missing one."""
+    assert await verify_password("ek-sms-dummy-password", "") is False
@@ -0,0 +1,18 @@
+"""
+User model tests.
+"""
+
+from app.modules.users.models import User
+
+
+def test_email_normalized_in_constructor():
+    """Test emails passed to the constructor are trimmed and lowercased."""
+    user = User(email=" A@B.COM ")
+    assert user.email == "a@b.com"
+
+
+def test_email_normalized_on_assignment():
+    """Test emails assigned after construction are trimmed and lowercased."""
+    user = User(email="a@b.com")
+    user.email = "\tMixed.Case@Example.COM\n"
+    assert user.email == "mixed.case@example.com"